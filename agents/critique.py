@@ -16,6 +16,17 @@ class CritiqueAgent(BaseAgent):
             "clarity": 15
         }
         
+    def process(self, user_input: str, context: Dict[str, Any] = {}) -> AgentResponse:
+        exchange_analysis = self.analyze_exchange(
+            user_input,
+            context.get("agent_argument", ""),
+            context.get("user_analysis")
+        )
+        return AgentResponse(
+            content=exchange_analysis["user_feedback"],
+            metadata=exchange_analysis
+        )
+    
     def analyze_exchange(self, user_argument: str, agent_argument: str, 
                         user_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
         
@@ -1,18 +1,24 @@
 from typing import Dict, Any, List
 from .base_agent import BaseAgent, AgentResponse
+from .topic_index import TopicIndex, get_default_index
 
 
 class DebatorAgent(BaseAgent):
-    def __init__(self):
+    def __init__(self, topic_index: TopicIndex = None):
         super().__init__("Debator")
         self.topic = None
+        self.topic_id = None
+        self.topic_index = topic_index or get_default_index()
         self.my_stance = None
         self.opponent_stance = None
         self.argument_count = 0
         self.key_points_made = []
         
-    def setup_debate(self, topic: str, agent_stance: str, user_stance: str):
+    def setup_debate(self, topic: str, agent_stance: str, user_stance: str, topic_id: str = None):
         self.topic = topic
+        if topic_id is None and topic:
+            topic_id = self.topic_index.canonicalize(topic)
+        self.topic_id = topic_id
         self.my_stance = agent_stance
         self.opponent_stance = user_stance
         self.argument_count = 0
@@ -27,8 +33,12 @@ class DebatorAgent(BaseAgent):
         
         self.add_to_history("user", user_input)
         
-        user_argument = self._analyze_user_argument(user_input)
-        counter_argument = self._generate_counter_argument(user_argument)
+        shed = context.get("shed", False)
+        if shed:
+            user_argument = self._empty_analysis()
+        else:
+            user_argument = self._analyze_user_argument(user_input)
+        counter_argument = self._generate_counter_argument(user_argument, skip_notes=shed)
         
         self.argument_count += 1
         
@@ -36,19 +46,24 @@ class DebatorAgent(BaseAgent):
             content=counter_argument,
             metadata={
                 "argument_number": self.argument_count,
+                "topic_id": self.topic_id,
                 "user_argument_analysis": user_argument,
-                "agent_stance": self.my_stance
+                "agent_stance": self.my_stance,
+                "shed": shed
             }
         )
     
-    def _analyze_user_argument(self, user_input: str) -> Dict[str, Any]:
-        analysis = {
+    def _empty_analysis(self) -> Dict[str, Any]:
+        return {
             "main_points": [],
             "evidence_provided": False,
             "logical_structure": "unclear",
             "emotional_appeals": False,
             "fallacies": []
         }
+    
+    def _analyze_user_argument(self, user_input: str) -> Dict[str, Any]:
+        analysis = self._empty_analysis()
         
         user_lower = user_input.lower()
         
@@ -69,7 +84,7 @@ class DebatorAgent(BaseAgent):
         
         return analysis
     
-    def _generate_counter_argument(self, user_analysis: Dict[str, Any]) -> str:
+    def _generate_counter_argument(self, user_analysis: Dict[str, Any], skip_notes: bool = False) -> str:
         stance_templates = {
             "for": {
                 "ai_healthcare": [
@@ -103,26 +118,17 @@ class DebatorAgent(BaseAgent):
             f"I appreciate the thought you've put into this, especially regarding {user_analysis['main_points'][0] if user_analysis['main_points'] else 'your position'}. Let me offer a counterpoint:",
         ]
         
-        if not user_analysis["evidence_provided"]:
-            evidence_challenge = " Furthermore, I notice your argument would be stronger with supporting evidence or examples."
-        else:
+        if skip_notes or user_analysis["evidence_provided"]:
             evidence_challenge = ""
+        else:
+            evidence_challenge = " Furthermore, I notice your argument would be stronger with supporting evidence or examples."
         
-        if user_analysis["fallacies"]:
+        if user_analysis["fallacies"] and not skip_notes:
             fallacy_note = f" I also notice some overgeneralization in your reasoning that we should address."
         else:
             fallacy_note = ""
         
-        topic_lower = self.topic.lower() if self.topic else ""
-        
-        if "ai" in topic_lower or "artificial intelligence" in topic_lower:
-            topic_key = "ai_healthcare"
-        elif "social media" in topic_lower:
-            topic_key = "social_media_responsibility"
-        else:
-            topic_key = "ai_healthcare"
-        
-        stance_responses = stance_templates.get(self.my_stance, {}).get(topic_key, [
+        stance_responses = stance_templates.get(self.my_stance, {}).get(self.topic_id, [
             f"I understand your position, but from the {self.my_stance} perspective, we must consider the broader implications.",
             f"You make some valid points, however arguing {self.my_stance} this topic reveals important considerations you may have overlooked.",
             f"While I respect your viewpoint, taking the {self.my_stance} stance shows us a different angle on this issue."
@@ -141,6 +147,7 @@ class DebatorAgent(BaseAgent):
     def get_debate_summary(self) -> Dict[str, Any]:
         return {
             "topic": self.topic,
+            "topic_id": self.topic_id,
             "agent_stance": self.my_stance,
             "total_arguments": self.argument_count,
             "key_points_made": self.key_points_made
@@ -0,0 +1,284 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+SEED_TOPICS = {
+    "ai_healthcare": [
+        "Artificial Intelligence should replace human decision-making in healthcare",
+        "AI should be used to make medical decisions",
+        "AI doctors should replace human doctors",
+        "AI in healthcare"
+    ],
+    "social_media_responsibility": [
+        "Social media platforms should be held responsible for misinformation",
+        "Social media companies should be accountable for fake news"
+    ],
+    "social_media_harm": [
+        "Social media does more harm than good"
+    ],
+    "remote_work": [
+        "Remote work is more productive than office work"
+    ],
+    "nuclear_energy": [
+        "Nuclear energy is the best solution to climate change",
+        "Nuclear power is the answer to climate change"
+    ],
+    "individual_climate_action": [
+        "Individual actions matter more than corporate responsibility for environment"
+    ],
+    "growth_vs_environment": [
+        "Economic growth should be prioritized over environmental protection"
+    ],
+    "standardized_testing": [
+        "Standardized testing accurately measures student ability"
+    ],
+    "college_debt": [
+        "College education is worth the debt",
+        "College is worth the student loan debt"
+    ],
+    "online_learning": [
+        "Online learning is as effective as in-person education"
+    ],
+    "universal_basic_income": [
+        "Universal basic income would solve poverty"
+    ],
+    "space_exploration_funding": [
+        "Space exploration funding should be redirected to Earth problems"
+    ]
+}
+
+PHRASES = {
+    "artificial intelligence": "ai",
+    "a.i.": "ai",
+    "universal basic income": "ubi",
+    "working from home": "wfh",
+    "work from home": "wfh",
+    "remote work": "wfh",
+    "social media": "socialmedia",
+    "climate change": "climate",
+    "global warming": "climate"
+}
+
+ALIASES = {
+    "medical": "healthcare",
+    "medicine": "healthcare",
+    "health": "healthcare",
+    "doctors": "healthcare",
+    "doctor": "healthcare"
+}
+
+STOPWORDS = {
+    "a", "an", "the", "of", "to", "in", "on", "for", "and", "or", "is", "are", "be", "should",
+    "would", "will", "it", "this", "that", "than", "as", "by", "with", "about", "i", "we",
+    "want", "debate", "topic", "motion", "whether", "do", "does", "more", "can"
+}
+
+NEGATIONS = {"not", "no", "never", "neither", "nor"}
+INVERSIONS = {"less", "fewer", "worse"}
+NEGATED = "!not"
+
+_CONTRACTIONS = re.compile(r"won't|can't|cannot|n't")
+_CONTRACTION_REPLACEMENTS = {"won't": " will not", "can't": " can not", "cannot": " can not", "n't": " not"}
+_PHRASE_PATTERN = re.compile(
+    r"(?<![a-z0-9])(" + "|".join(re.escape(phrase) for phrase in sorted(PHRASES, key=len, reverse=True)) + r")(?![a-z0-9])"
+)
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class TopicIndex:
+    def __init__(self, num_perm: int = 32, bands: int = 16, threshold: float = 0.5,
+                 min_word_overlap: float = 0.5, word_weight: int = 3, cache_size: int = 10000):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.min_word_overlap = min_word_overlap
+        self.word_weight = word_weight
+        self.cache_size = cache_size
+        self.masks = [self._mask(i) for i in range(num_perm)]
+        self.buckets = [{} for _ in range(bands)]
+        self.entries = []
+        self.topic_names = {}
+        self.exact_matches = {}
+        self.lookup_cache = OrderedDict()
+        self.miss_buckets = [{} for _ in range(bands)]
+        self.miss_signatures = {}
+        self.lock = threading.RLock()
+
+    def add(self, topic_id: str, text: str, name: str = None) -> bool:
+        key = self.normalize(text)
+        if not key:
+            return False
+
+        with self.lock:
+            if key in self.exact_matches:
+                return False
+
+            shingles = self._shingles(key)
+            signature = self._signature(shingles)
+            entry = len(self.entries)
+            self.entries.append((topic_id, shingles, frozenset(key.split())))
+            for band_key, bucket, miss_bucket in zip(self._band_keys(signature), self.buckets, self.miss_buckets):
+                bucket.setdefault(band_key, []).append(entry)
+                for cached_text in list(miss_bucket.get(band_key, ())):
+                    self._forget_miss(cached_text)
+            self.exact_matches[key] = (topic_id, 1.0)
+            self.topic_names.setdefault(topic_id, name or text)
+            return True
+
+    def lookup(self, text: str) -> Optional[Tuple[str, float]]:
+        with self.lock:
+            if text in self.lookup_cache:
+                self.lookup_cache.move_to_end(text)
+                return self.lookup_cache[text]
+
+            key = self.normalize(text)
+            signature = None
+            if not key:
+                best = None
+            elif key in self.exact_matches:
+                best = self.exact_matches[key]
+            else:
+                shingles = self._shingles(key)
+                signature = self._signature(shingles)
+                best = self._best_match(key, shingles, signature)
+                if best is not None:
+                    self.exact_matches[key] = best
+                    signature = None
+
+            self._cache(text, best, signature)
+            return best
+
+    def canonicalize(self, text: str, register: bool = True) -> Optional[str]:
+        with self.lock:
+            match = self.lookup(text)
+            if match is not None:
+                return match[0]
+            if not register:
+                return None
+
+            key = self.normalize(text)
+            if not key:
+                return None
+            topic_id = "topic_" + hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+            self.add(topic_id, text)
+            return topic_id
+
+    def get_topic_name(self, topic_id: str) -> Optional[str]:
+        return self.topic_names.get(topic_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "topics": len(self.topic_names),
+            "phrasings": len(self.entries),
+            "pinned_resolutions": len(self.exact_matches),
+            "cached_lookups": len(self.lookup_cache)
+        }
+
+    def normalize(self, text: str) -> str:
+        text = text.lower().replace("\u2019", "'")
+        text = _CONTRACTIONS.sub(lambda m: _CONTRACTION_REPLACEMENTS[m.group(0)], text)
+        text = _PHRASE_PATTERN.sub(lambda m: PHRASES[m.group(1)], text)
+
+        tokens = []
+        negated = False
+        for word in _WORD_PATTERN.findall(text):
+            if word in NEGATIONS or word in INVERSIONS:
+                negated = not negated
+                continue
+            token = ALIASES.get(word, word)
+            if token in STOPWORDS:
+                continue
+            if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+                token = token[:-1]
+            tokens.append(token)
+        if tokens and negated:
+            tokens.append(NEGATED)
+        return " ".join(tokens)
+
+    def _best_match(self, key: str, shingles: frozenset, signature: Tuple[int, ...]) -> Optional[Tuple[str, float]]:
+        words = set(key.split())
+        negated = NEGATED in words
+        candidates = set()
+        for band_key, bucket in zip(self._band_keys(signature), self.buckets):
+            candidates.update(bucket.get(band_key, ()))
+
+        best = None
+        for entry in candidates:
+            topic_id, other_shingles, other_words = self.entries[entry]
+            if (NEGATED in other_words) != negated:
+                continue
+            if len(words & other_words) / len(words | other_words) < self.min_word_overlap:
+                continue
+            confidence = len(shingles & other_shingles) / len(shingles | other_shingles)
+            if best is None or confidence > best[1]:
+                best = (topic_id, confidence)
+
+        if best is not None and best[1] < self.threshold:
+            return None
+        return best
+
+    def _cache(self, text: str, result: Optional[Tuple[str, float]], signature: Optional[Tuple[int, ...]]):
+        self.lookup_cache[text] = result
+        if signature is not None:
+            self.miss_signatures[text] = signature
+            for band_key, bucket in zip(self._band_keys(signature), self.miss_buckets):
+                bucket.setdefault(band_key, set()).add(text)
+        if len(self.lookup_cache) > self.cache_size:
+            oldest = next(iter(self.lookup_cache))
+            self._forget_miss(oldest)
+            self.lookup_cache.pop(oldest, None)
+
+    def _forget_miss(self, text: str):
+        self.lookup_cache.pop(text, None)
+        signature = self.miss_signatures.pop(text, None)
+        if signature is None:
+            return
+        for band_key, bucket in zip(self._band_keys(signature), self.miss_buckets):
+            cached = bucket.get(band_key)
+            if cached is not None:
+                cached.discard(text)
+                if not cached:
+                    del bucket[band_key]
+
+    def _shingles(self, key: str) -> frozenset:
+        tokens = key.split()
+        shingles = {f"{token}/{i}" for token in tokens for i in range(self.word_weight)}
+        for token in tokens:
+            padded = f"#{token}#"
+            shingles.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return frozenset(shingles)
+
+    def _signature(self, shingles: frozenset) -> Tuple[int, ...]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+            for shingle in shingles
+        ]
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self.masks)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> list:
+        return [signature[start:start + self.rows] for start in range(0, self.num_perm, self.rows)]
+
+    def _mask(self, seed: int) -> int:
+        return int.from_bytes(hashlib.blake2b(f"perm-{seed}".encode(), digest_size=8).digest(), "big")
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_index() -> TopicIndex:
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            index = TopicIndex()
+            for topic_id, phrasings in SEED_TOPICS.items():
+                for text in phrasings:
+                    index.add(topic_id, text, name=phrasings[0])
+            _default_index = index
+    return _default_index
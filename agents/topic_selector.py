@@ -1,14 +1,17 @@
 from typing import Dict, Any, List
 import json
 from .base_agent import BaseAgent, AgentResponse
+from .topic_index import TopicIndex, get_default_index
 
 
 class TopicSelectorAgent(BaseAgent):
-    def __init__(self):
+    def __init__(self, topic_index: TopicIndex = None):
         super().__init__("TopicSelector")
         self.state = "initial"
         self.selected_topic = None
+        self.selected_topic_id = None
         self.selected_stance = None
+        self.topic_index = topic_index or get_default_index()
         
     def process(self, user_input: str, context: Dict[str, Any] = {}) -> AgentResponse:
         if self.state == "initial":
@@ -36,10 +39,11 @@ class TopicSelectorAgent(BaseAgent):
         
         if "topic" in user_input.lower() and len(user_input.split()) > 3:
             self.selected_topic = user_input
+            self.selected_topic_id = self.topic_index.canonicalize(user_input, register=False)
             self.state = "topic_confirmation"
             return AgentResponse(
                 content=f"Great! I see you want to debate about: '{user_input}'\n\nIs this correct? (yes/no)\n\nOr type 'exit' to quit.",
-                metadata={"topic": user_input}
+                metadata={"topic": user_input, "topic_id": self.selected_topic_id}
             )
         else:
             self.state = "topic_discovery"
@@ -79,6 +83,8 @@ class TopicSelectorAgent(BaseAgent):
                 content=f"Perfect! We'll debate: '{self.selected_topic}'\n\nWould you like to argue FOR or AGAINST this topic? (for/against)\n\nOr type 'exit' to quit."
             )
         elif user_input.lower() in ["no", "n"]:
+            self.selected_topic = None
+            self.selected_topic_id = None
             self.state = "topic_discovery"
             return AgentResponse(
                 content="No problem! Let's find a better topic. What interests you?"
@@ -115,10 +121,13 @@ class TopicSelectorAgent(BaseAgent):
                 content="Please choose 'for' or 'against', or type 'exit' to quit."
             )
         
+        self.selected_topic_id = self.topic_index.canonicalize(self.selected_topic)
+        
         return AgentResponse(
             content=f"Excellent! You'll argue {self.selected_stance.upper()} the topic: '{self.selected_topic}'\n\nLet's begin the debate! Make your opening argument.",
             metadata={
                 "topic": self.selected_topic,
+                "topic_id": self.selected_topic_id,
                 "user_stance": self.selected_stance,
                 "agent_stance": "against" if self.selected_stance == "for" else "for"
             },
@@ -156,6 +165,7 @@ class TopicSelectorAgent(BaseAgent):
     def get_debate_setup(self) -> Dict[str, str]:
         return {
             "topic": self.selected_topic,
+            "topic_id": self.selected_topic_id,
             "user_stance": self.selected_stance,
             "agent_stance": "against" if self.selected_stance == "for" else "for"
         }
\ No newline at end of file
@@ -2,12 +2,17 @@ from typing import Dict, Any
 from agents.topic_selector import TopicSelectorAgent
 from agents.debator import DebatorAgent
 from agents.critique import CritiqueAgent
+from agents.topic_index import TopicIndex, get_default_index
+from scheduler import Scheduler, get_default_scheduler
 
 
 class DebateSystem:
-    def __init__(self):
-        self.topic_selector = TopicSelectorAgent()
-        self.debator = DebatorAgent()
+    def __init__(self, tenant: str = "default", scheduler: Scheduler = None, topic_index: TopicIndex = None):
+        self.tenant = tenant
+        self.scheduler = scheduler or get_default_scheduler()
+        self.topic_index = topic_index or get_default_index()
+        self.topic_selector = TopicSelectorAgent(self.topic_index)
+        self.debator = DebatorAgent(self.topic_index)
         self.critique = CritiqueAgent()
         self.state = "topic_selection"
         self.debate_setup = None
@@ -23,7 +28,8 @@ class DebateSystem:
                 self.debator.setup_debate(
                     self.debate_setup["topic"],
                     self.debate_setup["agent_stance"],
-                    self.debate_setup["user_stance"]
+                    self.debate_setup["user_stance"],
+                    self.debate_setup.get("topic_id")
                 )
                 self.state = "debating"
                 return response.content
@@ -35,13 +41,20 @@ class DebateSystem:
                 self.state = "evaluation"
                 return self._generate_final_evaluation()
             
-            debator_response = self.debator.process(user_input)
+            debator_response = self.scheduler.run(
+                lambda: self.debator.process(user_input),
+                tenant=self.tenant,
+                priority="interactive",
+                fallback=lambda: self.debator.process(user_input, {"shed": True})
+            )
             
             if debator_response.next_action == "end_debate":
                 self.state = "evaluation" 
                 return self._generate_final_evaluation()
             
             user_analysis = debator_response.metadata.get("user_argument_analysis", {})
+            if debator_response.metadata.get("shed"):
+                user_analysis = None
             critique_analysis = self.critique.analyze_exchange(
                 user_input, 
                 debator_response.content,
@@ -102,12 +115,21 @@ class DebateSystem:
         return result
     
     def restart(self):
-        self.topic_selector = TopicSelectorAgent()
-        self.debator = DebatorAgent()
+        self.topic_selector = TopicSelectorAgent(self.topic_index)
+        self.debator = DebatorAgent(self.topic_index)
         self.critique = CritiqueAgent()
         self.state = "topic_selection"
         self.debate_setup = None
         return "Welcome back! Let's start a new debate. What topic interests you?"
     
+    def submit_batch(self, func, tenant: str = None):
+        return self.scheduler.submit(func, tenant=tenant or self.tenant, priority="batch")
+    
+    def run_idle(self, max_items: int = None, time_budget: float = 0.5) -> int:
+        return self.scheduler.drain(max_items, time_budget)
+    
+    def get_scheduler_metrics(self) -> Dict[str, Any]:
+        return self.scheduler.get_metrics()
+    
     def get_state(self) -> str:
         return self.state
\ No newline at end of file
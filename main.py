@@ -40,6 +40,8 @@ def main():
             response = debate_system.process_input(user_input)
             print(f"\n{response}")
             
+            debate_system.run_idle()
+            
         except KeyboardInterrupt:
             print("\n\nGoodbye! Thanks for using the Debate Agent System!")
             break
@@ -0,0 +1,229 @@
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, Callable, Optional
+
+
+PRIORITIES = ["interactive", "batch"]
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.last_refill = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+
+class WorkItem:
+    def __init__(self, func: Callable[[], Any], tenant: str, priority: str,
+                 deadline: Optional[float], fallback: Optional[Callable[[], Any]], submitted_at: float):
+        self.func = func
+        self.tenant = tenant
+        self.priority = priority
+        self.deadline = deadline
+        self.fallback = fallback
+        self.submitted_at = submitted_at
+        self.status = "queued"
+        self.result = None
+        self.error = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ["completed", "shed", "rejected", "failed"]
+
+
+class Scheduler:
+    def __init__(self, rate_limits: Dict[str, tuple] = None, max_queue_depth: Dict[str, int] = None,
+                 default_timeouts: Dict[str, Optional[float]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.rate_limits = {
+            "interactive": (5.0, 10.0),
+            "batch": (2.0, 5.0),
+            **(rate_limits or {})
+        }
+        self.max_queue_depth = {
+            "interactive": 100,
+            "batch": 1000,
+            **(max_queue_depth or {})
+        }
+        self.default_timeouts = {
+            "interactive": 2.0,
+            "batch": None,
+            **(default_timeouts or {})
+        }
+        self.queues = {priority: OrderedDict() for priority in PRIORITIES}
+        self.buckets = {}
+        self.latencies = {priority: deque(maxlen=1000) for priority in PRIORITIES}
+        self.service_times = {priority: None for priority in PRIORITIES}
+        self.counters = {
+            priority: {"submitted": 0, "completed": 0, "late": 0, "shed": 0, "rejected": 0, "failed": 0}
+            for priority in PRIORITIES
+        }
+
+    def submit(self, func: Callable[[], Any], tenant: str = "default", priority: str = "interactive",
+               timeout: Optional[float] = None, fallback: Callable[[], Any] = None) -> WorkItem:
+        if priority not in self.queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        now = self.clock()
+        if timeout is None:
+            timeout = self.default_timeouts.get(priority)
+        deadline = now + timeout if timeout is not None else None
+
+        item = WorkItem(func, tenant, priority, deadline, fallback, now)
+        self.counters[priority]["submitted"] += 1
+
+        if self.queue_depth(priority) >= self.max_queue_depth[priority]:
+            self._shed(item, "rejected")
+            return item
+
+        self.queues[priority].setdefault(tenant, deque()).append(item)
+        return item
+
+    def run_next(self) -> Optional[WorkItem]:
+        for priority in PRIORITIES:
+            item = self._pop_fair(priority)
+            if item is not None:
+                self._execute(item)
+                return item
+        return None
+
+    def run(self, func: Callable[[], Any], tenant: str = "default", priority: str = "interactive",
+            timeout: Optional[float] = None, fallback: Callable[[], Any] = None) -> Any:
+        item = self.submit(func, tenant, priority, timeout, fallback)
+        while not item.done:
+            if self.run_next() is None:
+                self._remove(item)
+                self._shed(item, "shed")
+                if item.fallback is None:
+                    item.error = RuntimeError(f"No {priority} capacity available for tenant {tenant}")
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def drain(self, max_items: Optional[int] = None, time_budget: Optional[float] = None) -> int:
+        started = self.clock()
+        processed = 0
+        while max_items is None or processed < max_items:
+            if time_budget is not None and not self._fits_budget(started, time_budget):
+                break
+            if self.run_next() is None:
+                break
+            processed += 1
+        return processed
+
+    def queue_depth(self, priority: str) -> int:
+        return sum(len(queue) for queue in self.queues[priority].values())
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = {}
+        for priority in PRIORITIES:
+            latencies = sorted(self.latencies[priority])
+            metrics[priority] = {
+                "queue_depth": self.queue_depth(priority),
+                "tenants_waiting": len(self.queues[priority]),
+                **self.counters[priority],
+                "p50_latency": self._percentile(latencies, 0.50),
+                "p99_latency": self._percentile(latencies, 0.99)
+            }
+        return metrics
+
+    def _bucket(self, tenant: str, priority: str) -> TokenBucket:
+        key = (tenant, priority)
+        if key not in self.buckets:
+            rate, capacity = self.rate_limits[priority]
+            self.buckets[key] = TokenBucket(rate, capacity, self.clock)
+        return self.buckets[key]
+
+    def _pop_fair(self, priority: str) -> Optional[WorkItem]:
+        tenants = self.queues[priority]
+        for _ in range(len(tenants)):
+            tenant, queue = next(iter(tenants.items()))
+            tenants.move_to_end(tenant)
+
+            if priority == "batch" and not self._bucket(tenant, priority).try_acquire():
+                continue
+
+            item = queue.popleft()
+            if not queue:
+                del tenants[tenant]
+            return item
+        return None
+
+    def _remove(self, item: WorkItem):
+        tenants = self.queues[item.priority]
+        queue = tenants.get(item.tenant)
+        if queue is not None and item in queue:
+            queue.remove(item)
+            if not queue:
+                del tenants[item.tenant]
+
+    def _fits_budget(self, started: float, time_budget: float) -> bool:
+        priority = next((p for p in PRIORITIES if self.queues[p]), None)
+        if priority is None:
+            return True
+        estimate = self.service_times[priority] or 0.0
+        return self.clock() - started + estimate <= time_budget
+
+    def _execute(self, item: WorkItem):
+        now = self.clock()
+        if item.deadline is not None and now > item.deadline:
+            self._shed(item, "shed")
+        elif item.priority == "interactive" and not self._bucket(item.tenant, item.priority).try_acquire():
+            self._shed(item, "shed")
+        else:
+            try:
+                item.result = item.func()
+                item.status = "completed"
+            except Exception as e:
+                item.error = e
+                item.status = "failed"
+            finished = self.clock()
+            self._record_service_time(item.priority, finished - now)
+            self.counters[item.priority][item.status] += 1
+            if item.status == "completed" and item.deadline is not None and finished > item.deadline:
+                self.counters[item.priority]["late"] += 1
+        self.latencies[item.priority].append(self.clock() - item.submitted_at)
+
+    def _record_service_time(self, priority: str, elapsed: float):
+        previous = self.service_times[priority]
+        self.service_times[priority] = elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+
+    def _shed(self, item: WorkItem, status: str):
+        if item.fallback is not None:
+            try:
+                item.result = item.fallback()
+            except Exception as e:
+                item.error = e
+        item.status = status
+        self.counters[item.priority][status] += 1
+
+    def _percentile(self, values: list, fraction: float) -> Optional[float]:
+        if not values:
+            return None
+        index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+        return round(values[index], 4)
+
+
+_default_scheduler = None
+
+
+def get_default_scheduler() -> Scheduler:
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = Scheduler()
+    return _default_scheduler
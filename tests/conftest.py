@@ -0,0 +1,12 @@
+import pytest
+
+from agents.topic_index import SEED_TOPICS, TopicIndex
+
+
+@pytest.fixture
+def index():
+    index = TopicIndex()
+    for topic_id, phrasings in SEED_TOPICS.items():
+        for text in phrasings:
+            index.add(topic_id, text, name=phrasings[0])
+    return index
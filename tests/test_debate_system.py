@@ -0,0 +1,79 @@
+import pytest
+
+from debate_system import DebateSystem
+from scheduler import Scheduler, get_default_scheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def start_debate(system: DebateSystem):
+    system.process_input("I want to debate the topic of AI in healthcare")
+    system.process_input("yes")
+    system.process_input("for")
+    assert system.get_state() == "debating"
+
+
+@pytest.fixture
+def critique_calls(monkeypatch):
+    calls = []
+    original = DebateSystem.__init__
+
+    def init(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        analyze = self.critique.analyze_exchange
+
+        def record(user_argument, agent_argument, user_analysis=None):
+            calls.append(user_analysis)
+            return analyze(user_argument, agent_argument, user_analysis)
+
+        self.critique.analyze_exchange = record
+
+    monkeypatch.setattr(DebateSystem, "__init__", init)
+    return calls
+
+
+def test_systems_share_the_default_scheduler(index):
+    assert DebateSystem(topic_index=index).scheduler is get_default_scheduler()
+    assert DebateSystem(topic_index=index).scheduler is DebateSystem(topic_index=index).scheduler
+
+
+def test_debate_turn_runs_through_scheduler(index, critique_calls):
+    scheduler = Scheduler(clock=FakeClock())
+    system = DebateSystem(tenant="alice", scheduler=scheduler, topic_index=index)
+    start_debate(system)
+
+    response = system.process_input("AI is good because research shows it saves lives.")
+
+    assert "Feedback" in response
+    assert system.debate_setup["topic_id"] == "ai_healthcare"
+    assert critique_calls[-1]["evidence_provided"] is True
+    assert scheduler.get_metrics()["interactive"]["completed"] == 1
+
+
+def test_shed_turn_falls_back_to_critique_scoring(index, critique_calls):
+    scheduler = Scheduler(rate_limits={"interactive": (0.0, 1.0)}, clock=FakeClock())
+    system = DebateSystem(scheduler=scheduler, topic_index=index)
+    start_debate(system)
+
+    system.process_input("Everyone knows AI always helps.")
+    response = system.process_input("Everyone knows AI always helps.")
+
+    assert "overgeneralization" not in response.split("---")[0]
+    assert critique_calls[-1] is None
+    assert scheduler.get_metrics()["interactive"]["shed"] == 1
+
+
+def test_run_idle_drains_batch_work(index):
+    scheduler = Scheduler(clock=FakeClock())
+    system = DebateSystem(scheduler=scheduler, topic_index=index)
+    ran = []
+    system.submit_batch(lambda: ran.append("regrade"))
+
+    assert system.run_idle() == 1
+    assert ran == ["regrade"]
@@ -0,0 +1,37 @@
+from agents.debator import DebatorAgent
+
+
+ARGUMENT = "Everyone knows AI always helps patients."
+
+
+def make_debator(index):
+    debator = DebatorAgent(index)
+    debator.setup_debate("Should AI replace doctors?", "against", "for")
+    return debator
+
+
+def test_full_path_adds_evidence_and_fallacy_notes(index):
+    response = make_debator(index).process(ARGUMENT)
+
+    assert response.metadata["shed"] is False
+    assert response.metadata["user_argument_analysis"]["fallacies"] == ["overgeneralization"]
+    assert "supporting evidence" in response.content
+    assert "overgeneralization" in response.content
+
+
+def test_shed_path_skips_analysis_and_notes(index):
+    response = make_debator(index).process(ARGUMENT, {"shed": True})
+
+    assert response.metadata["shed"] is True
+    assert response.metadata["user_argument_analysis"]["evidence_provided"] is False
+    assert response.metadata["user_argument_analysis"]["fallacies"] == []
+    assert "supporting evidence" not in response.content
+    assert "overgeneralization" not in response.content
+
+
+def test_setup_debate_accepts_missing_topic(index):
+    debator = DebatorAgent(index)
+    debator.setup_debate(None, "for", "against")
+
+    assert debator.topic_id is None
+    assert "What's your response" in debator.process("Some argument here.").content
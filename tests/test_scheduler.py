@@ -0,0 +1,132 @@
+import pytest
+
+from scheduler import Scheduler, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_token_bucket_allows_burst_then_refills(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3.0, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.advance(0.5)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.advance(10)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_batch_round_robins_across_tenants(clock):
+    scheduler = Scheduler(rate_limits={"batch": (100.0, 100.0)}, clock=clock)
+    order = []
+    for tenant in ["a", "b", "c"]:
+        for i in range(2):
+            scheduler.submit(lambda t=tenant, i=i: order.append((t, i)), tenant=tenant, priority="batch")
+
+    assert scheduler.drain() == 6
+    assert order == [("a", 0), ("b", 0), ("c", 0), ("a", 1), ("b", 1), ("c", 1)]
+
+
+def test_interactive_runs_before_batch(clock):
+    scheduler = Scheduler(clock=clock)
+    order = []
+    scheduler.submit(lambda: order.append("batch-1"), priority="batch")
+    scheduler.submit(lambda: order.append("batch-2"), priority="batch")
+    scheduler.submit(lambda: order.append("interactive-1"), tenant="other")
+    scheduler.submit(lambda: order.append("interactive-2"))
+
+    scheduler.drain()
+
+    assert order == ["interactive-1", "interactive-2", "batch-1", "batch-2"]
+
+
+def test_full_queue_rejects_with_fallback(clock):
+    scheduler = Scheduler(max_queue_depth={"interactive": 1}, clock=clock)
+    scheduler.submit(lambda: "first")
+
+    item = scheduler.submit(lambda: "second", fallback=lambda: "fallback")
+
+    assert item.status == "rejected"
+    assert item.result == "fallback"
+    assert scheduler.get_metrics()["interactive"]["rejected"] == 1
+
+
+def test_expired_item_is_shed_to_fallback(clock):
+    scheduler = Scheduler(clock=clock)
+    item = scheduler.submit(lambda: "full", timeout=1.0, fallback=lambda: "template")
+
+    clock.advance(2.0)
+    scheduler.run_next()
+
+    assert item.status == "shed"
+    assert item.result == "template"
+    assert scheduler.get_metrics()["interactive"]["shed"] == 1
+
+
+def test_late_completion_is_counted_separately_from_shed(clock):
+    scheduler = Scheduler(clock=clock)
+
+    def slow():
+        clock.advance(5.0)
+        return "full"
+
+    assert scheduler.run(slow, timeout=1.0, fallback=lambda: "template") == "full"
+    metrics = scheduler.get_metrics()["interactive"]
+    assert metrics["completed"] == 1
+    assert metrics["late"] == 1
+    assert metrics["shed"] == 0
+
+
+def test_run_does_not_leave_unschedulable_batch_work_queued(clock):
+    scheduler = Scheduler(rate_limits={"batch": (0.0, 1.0)}, clock=clock)
+    ran = []
+
+    assert scheduler.run(lambda: ran.append(1) or "first", priority="batch") == "first"
+    assert scheduler.run(lambda: ran.append(2), priority="batch", fallback=lambda: "fallback") == "fallback"
+    with pytest.raises(RuntimeError):
+        scheduler.run(lambda: ran.append(3), priority="batch")
+
+    assert scheduler.queue_depth("batch") == 0
+    assert scheduler.drain() == 0
+    assert ran == [1]
+    assert scheduler.get_metrics()["batch"]["shed"] == 2
+
+
+def test_drain_stops_before_overrunning_time_budget(clock):
+    scheduler = Scheduler(rate_limits={"batch": (100.0, 100.0)}, clock=clock)
+    ran = []
+
+    def job(i):
+        clock.advance(0.3)
+        ran.append(i)
+
+    for i in range(5):
+        scheduler.submit(lambda i=i: job(i), priority="batch")
+
+    assert scheduler.drain(time_budget=0.5) == 1
+    assert scheduler.drain(time_budget=1.0) == 3
+    assert ran == [0, 1, 2, 3]
+
+
+def test_partial_config_keeps_defaults(clock):
+    scheduler = Scheduler(rate_limits={"interactive": (1.0, 1.0)}, max_queue_depth={"batch": 5}, clock=clock)
+    scheduler.submit(lambda: None, priority="batch")
+    scheduler.submit(lambda: None)
+
+    assert scheduler.drain() == 2
@@ -0,0 +1,141 @@
+import threading
+
+import pytest
+
+from agents.topic_index import SEED_TOPICS, TopicIndex
+from agents.topic_selector import TopicSelectorAgent
+
+
+@pytest.mark.parametrize("text, topic_id", [
+    ("Should AI replace doctors?", "ai_healthcare"),
+    ("artificial intelligence in medicine", "ai_healthcare"),
+    ("Social media companies are responsible for misinformation", "social_media_responsibility"),
+    ("Is social media doing more harm than good?", "social_media_harm"),
+    ("UBI would end poverty", "universal_basic_income"),
+    ("Nuclear power is the best answer to climate change", "nuclear_energy"),
+    ("Is college worth the student debt?", "college_debt"),
+    ("Remote work is more productive than working in an office", "remote_work"),
+])
+def test_paraphrases_map_to_seed_id(index, text, topic_id):
+    assert index.canonicalize(text, register=False) == topic_id
+
+
+@pytest.mark.parametrize("text", [
+    "What he said about maintaining roads",
+    "AI should replace teachers",
+    "Social media should be banned for children",
+    "Nuclear weapons should be abolished",
+    "AI should not replace doctors",
+    "College education is not worth the debt",
+    "College education isn't worth the debt",
+    "Remote work is less productive than office work",
+    "Social media does less harm than good",
+])
+def test_unrelated_motions_get_new_ids(index, text):
+    topic_id = index.canonicalize(text)
+
+    assert topic_id not in SEED_TOPICS
+    assert topic_id.startswith("topic_")
+
+
+def test_canonicalize_is_idempotent_after_registration(index):
+    topic_id = index.canonicalize("Video games should be taught in schools")
+
+    assert index.canonicalize("Video games should be taught in schools") == topic_id
+    assert index.canonicalize("Video games are art") != topic_id
+
+
+def test_similar_templated_motions_stay_distinct():
+    index = TopicIndex()
+    words = ["tax", "zoning", "housing", "water", "transit", "energy", "fishing", "mining"]
+
+    ids = {index.canonicalize(f"motion {n} regarding {word} policy") for n, word in enumerate(words)}
+
+    assert len(ids) == len(words)
+
+
+def test_empty_normalized_text_gets_no_id(index):
+    phrasings = index.get_stats()["phrasings"]
+
+    assert index.canonicalize("the topic") is None
+    assert index.lookup("a debate") is None
+    assert index.get_stats()["phrasings"] == phrasings
+
+
+def test_negated_motions_share_an_id_with_each_other(index):
+    topic_id = index.canonicalize("AI should not replace doctors")
+
+    assert topic_id != "ai_healthcare"
+    assert index.canonicalize("AI shouldn't replace doctors") == topic_id
+    assert index.canonicalize("Remote work is not less productive than office work") == "remote_work"
+
+
+def test_lookup_cache_is_bounded(index):
+    index.cache_size = 2
+
+    for text in ["Homework should be banned", "Zoos are unethical", "Cars should be banned downtown"]:
+        index.lookup(text)
+
+    assert index.get_stats()["cached_lookups"] == 2
+    assert len(index.miss_signatures) == 2
+
+
+def test_add_only_evicts_colliding_cached_misses(index):
+    assert index.lookup("Zoos are unethical") is None
+    assert index.lookup("Should AI replace doctors?")[0] == "ai_healthcare"
+    index.lookup("Homework should be banned")
+
+    index.add("zoos", "Zoos are unethical")
+
+    assert "Zoos are unethical" not in index.lookup_cache
+    assert "Should AI replace doctors?" in index.lookup_cache
+    assert "Homework should be banned" in index.lookup_cache
+    assert index.lookup("Zoos are unethical") == ("zoos", 1.0)
+
+
+def test_resolutions_stay_pinned_after_closer_topic_is_added(index):
+    assert index.canonicalize("Should AI replace doctors?") == "ai_healthcare"
+
+    assert index.add("ai_doctors", "AI should replace doctors entirely")
+    index.lookup_cache.clear()
+
+    assert index.canonicalize("Should AI replace doctors?") == "ai_healthcare"
+    assert index.canonicalize("Should AI replace doctors completely?") == "ai_doctors"
+
+
+def test_duplicate_phrasing_keeps_first_id(index):
+    assert not index.add("other", "AI in healthcare")
+
+    assert index.lookup("AI in healthcare") == ("ai_healthcare", 1.0)
+    assert index.get_topic_name("other") is None
+
+
+def test_concurrent_registration_yields_one_id(index):
+    results = []
+
+    def register():
+        results.append(index.canonicalize("Zoos should be closed"))
+
+    threads = [threading.Thread(target=register) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == 1
+    assert index.get_stats()["topics"] == len(SEED_TOPICS) + 1
+
+
+def test_topic_selector_registers_only_after_stance(index):
+    selector = TopicSelectorAgent(index)
+    phrasings = index.get_stats()["phrasings"]
+
+    selector.process("I want to debate the topic of zoos being unethical")
+    selector.process("no")
+    selector.process("animals")
+    selector.process("maybe")
+    assert index.get_stats()["phrasings"] == phrasings
+
+    response = selector.process("for")
+    assert response.metadata["topic_id"] == index.canonicalize("maybe", register=False)
+    assert index.get_stats()["phrasings"] == phrasings + 1